@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+ATAVIC Tools
+Importable versions of generate-pages.py, fix-links.py and update-links.py,
+so they can run from hooks and batch jobs without touching the working directory
+"""
+
+import hashlib
+import json
+import os
+
+from page_generator import NAV_MANIFEST, ATAVICPageGenerator
+
+# (old, new) href rewrites applied by fix-links.py and update-links.py
+FIX_LINKS = ('href="../index.html"', 'href="../diagram/index.html"')
+UPDATE_LINKS = ('href="../diagram/index.html"', 'href="../diagram/diagram.html"')
+
+# Written into the pages directory after a complete build; records which
+# generator, config and template produced the pages there
+BUILD_STAMP = '.atavic-build'
+
+
+def render_page(template, page):
+    """Fill a config template's {{TITLE}} and {{ELEMENT_ID}} for one page entry"""
+    html = template.replace('{{TITLE}}', page['title'])
+    return html.replace('{{ELEMENT_ID}}', page['elementId'])
+
+
+def build_stamp(generator, *sources):
+    """Identify a build by generator name plus the config/template/source text it used"""
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(source if isinstance(source, bytes) else str(source).encode('utf-8'))
+        digest.update(b'\0')
+    return f"{generator} {digest.hexdigest()}"
+
+
+def read_stamp(pages_dir):
+    try:
+        with open(os.path.join(pages_dir, BUILD_STAMP), 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def write_stamp(pages_dir, stamp):
+    with open(os.path.join(pages_dir, BUILD_STAMP), 'w', encoding='utf-8') as f:
+        f.write(stamp + '\n')
+
+
+def clear_stamp(pages_dir):
+    try:
+        os.remove(os.path.join(pages_dir, BUILD_STAMP))
+    except FileNotFoundError:
+        pass
+
+
+def pages_up_to_date(pages_dir, outputs, stamp):
+    """True if pages_dir was last fully built with `stamp` and every output still exists"""
+    return read_stamp(pages_dir) == stamp and all(os.path.exists(path) for path in outputs)
+
+
+def write_if_changed(path, content):
+    """Write content unless the file already holds it; return True if written"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
+def build_pages(pages_data, pages_dir, manifest_path, force=False, verbose=True, render=render_page):
+    """Write a parsed config's pages and navigation manifest unless they are up to date.
+
+    Shared by generate_pages and the batch builder, which passes its cached
+    renderer. Returns None if up to date, otherwise a list of
+    (page path, html, written) for every page.
+    """
+    # The template is part of the config, and render_page lives in this file
+    with open(__file__, 'rb') as f:
+        stamp = build_stamp('generate-pages', json.dumps(pages_data, sort_keys=True),
+                            os.path.abspath(manifest_path), f.read())
+    outputs = [os.path.join(pages_dir, page['filename']) for page in pages_data['pages']]
+    outputs.append(manifest_path)
+
+    if not force and pages_up_to_date(pages_dir, outputs, stamp):
+        if verbose:
+            print(f"✅ Up to date: {pages_dir}")
+        return None
+
+    if verbose:
+        print('Generating HTML pages from template...')
+
+    os.makedirs(pages_dir, exist_ok=True)
+    clear_stamp(pages_dir)
+
+    pages = []
+    for page in pages_data['pages']:
+        html = render(pages_data['template'], page)
+
+        filepath = os.path.join(pages_dir, page['filename'])
+        written = write_if_changed(filepath, html)
+        pages.append((filepath, html, written))
+
+        if verbose and written:
+            print(f"✅ Generated: {filepath}")
+
+    manifest = ATAVICPageGenerator().serialize_navigation_manifest(pages_data)
+    if write_if_changed(manifest_path, manifest) and verbose:
+        print(f"✅ Generated: {manifest_path}")
+
+    write_stamp(pages_dir, stamp)
+    return pages
+
+
+def generate_pages(config_file="atavic-pages.json", pages_dir=None, manifest_path=None,
+                   force=False, verbose=True):
+    """Render every page of a config's template and write the navigation manifest.
+
+    pages_dir and manifest_path default to pages/ and atavic-nav.json next to
+    the config. Returns the list of rewritten page paths (empty if up to date).
+    """
+    config_dir = os.path.dirname(config_file)
+    pages_dir = pages_dir or os.path.join(config_dir, 'pages')
+    manifest_path = manifest_path or os.path.join(config_dir, NAV_MANIFEST)
+
+    with open(config_file, 'r', encoding='utf-8') as f:
+        pages_data = json.load(f)
+
+    pages = build_pages(pages_data, pages_dir, manifest_path, force, verbose)
+    return [filepath for filepath, _, written in pages or () if written]
+
+
+def rewrite_links(pages_dir, old, new, verbose=True):
+    """Replace `old` with `new` in every HTML page; only changed files are rewritten"""
+    if not os.path.isdir(pages_dir):
+        raise FileNotFoundError(f"Pages directory not found: {pages_dir}")
+
+    changed = []
+    for filename in sorted(os.listdir(pages_dir)):
+        if not filename.endswith('.html'):
+            continue
+        filepath = os.path.join(pages_dir, filename)
+        with open(filepath, 'r') as f:
+            content = f.read()
+
+        if old not in content:
+            continue
+
+        with open(filepath, 'w') as f:
+            f.write(content.replace(old, new))
+        changed.append(filepath)
+
+        if verbose:
+            print(f"✅ Updated: {filepath}")
+
+    return changed
+
+
+def fix_links(pages_dir="pages", verbose=True):
+    """Point back links at the diagram directory"""
+    return rewrite_links(pages_dir, *FIX_LINKS, verbose=verbose)
+
+
+def update_links(pages_dir="pages", verbose=True):
+    """Point back links at diagram.html"""
+    return rewrite_links(pages_dir, *UPDATE_LINKS, verbose=verbose)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+ATAVIC Batch Builder
+Builds several diagram projects (SVG + pages config + output directory) in one
+process, sharing the rendered-page, parsed-SVG and link-check caches.
+
+Projects run on a thread pool, which only overlaps file I/O: SVG parsing and
+rendering are CPU-bound and serialised by the GIL, so the gain over separate
+runs comes from one interpreter start and the shared caches, not parallel CPU.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from atavic_tools import build_pages, render_page
+from page_generator import NAV_MANIFEST
+
+LINK_PATTERN = re.compile(r'(?:href|src)="([^"]*)"')
+SVG_SHAPES = ('path', 'circle', 'ellipse', 'rect', 'line', 'polygon')
+
+
+class ATAVICBatchBuilder:
+    def __init__(self, workers=4):
+        self.workers = workers
+        self._lock = threading.Lock()
+        # Shared between every project built by this instance
+        self.render_cache = {}
+        self.svg_cache = {}
+        self.link_cache = {}
+
+    def load_projects(self, projects_file):
+        """Read a projects file; svg/config/output paths are relative to it"""
+        with open(projects_file, 'r') as f:
+            data = json.load(f)
+
+        base = Path(projects_file).resolve().parent
+        projects = []
+        for index, project in enumerate(data['projects']):
+            projects.append({
+                'name': project.get('name', f"project-{index + 1}"),
+                'svg': base / project['svg'],
+                'config': base / project['config'],
+                'output': base / project['output'],
+            })
+        return projects
+
+    def render(self, template, page):
+        """Render a page once per (template, title, elementId) across all projects"""
+        key = (template, page['title'], page['elementId'])
+        with self._lock:
+            html = self.render_cache.get(key)
+        if html is None:
+            html = render_page(template, page)
+            with self._lock:
+                self.render_cache[key] = html
+        return html
+
+    def parse_svg(self, svg_path):
+        """Parse an SVG once per (path, size, mtime) and summarise its shapes"""
+        stat = os.stat(svg_path)
+        key = (str(Path(svg_path).resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            summary = self.svg_cache.get(key)
+        if summary is not None:
+            return summary
+
+        root = ET.parse(svg_path).getroot()
+        shapes = sum(1 for el in root.iter() if el.tag.rsplit('}', 1)[-1] in SVG_SHAPES)
+        summary = {'bytes': stat.st_size, 'shapes': shapes}
+        with self._lock:
+            self.svg_cache[key] = summary
+        return summary
+
+    def check_link(self, page_path, link):
+        """Return True if a relative link from page_path resolves to an existing file"""
+        if not link or link.startswith(('http:', 'https:', '//', 'mailto:', '#', 'data:')):
+            return True
+        target = (Path(page_path).parent / link.split('#', 1)[0].split('?', 1)[0]).resolve()
+        with self._lock:
+            exists = self.link_cache.get(target)
+        if exists is None:
+            exists = target.exists()
+            with self._lock:
+                self.link_cache[target] = exists
+        return exists
+
+    def build_project(self, project):
+        """Generate pages, navigation manifest and SVG copy for one project.
+
+        Returns the project's result and the (page path, filename, link) triples
+        to check once every project has been written.
+        """
+        result = {
+            'name': project['name'],
+            'output': str(project['output']),
+            'pages': 0,
+            'written': 0,
+            'broken_links': [],
+            'error': None,
+        }
+        links = []
+        try:
+            with open(project['config'], 'r') as f:
+                data = json.load(f)
+
+            result['svg'] = self.parse_svg(project['svg'])
+
+            output_dir = Path(project['output'])
+            pages_dir = output_dir / 'pages'
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            svg_target = output_dir / 'ATAVIC.svg'
+            if Path(project['svg']).resolve() != svg_target.resolve():
+                shutil.copyfile(project['svg'], svg_target)
+
+            pages = build_pages(data, pages_dir, output_dir / NAV_MANIFEST, verbose=False, render=self.render)
+            if pages is None:
+                # Up to date: nothing written, but links are still checked
+                pages = [(pages_dir / page['filename'], self.render(data['template'], page), False)
+                         for page in data['pages']]
+
+            for page_path, html, written in pages:
+                result['pages'] += 1
+                result['written'] += written
+                links.extend((page_path, Path(page_path).name, link) for link in LINK_PATTERN.findall(html))
+        except Exception as e:
+            # Any bad config or SVG fails only its own project, not the whole batch
+            result['error'] = f"{type(e).__name__}: {e}"
+        return result, links
+
+    def check_links(self, result, links):
+        for page_path, filename, link in links:
+            if not self.check_link(page_path, link):
+                result['broken_links'].append(f"{filename}: {link}")
+
+    def build(self, projects):
+        """Build every project across the worker pool and return the combined summary"""
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            built = list(pool.map(self.build_project, projects))
+
+            # Links are checked only after every project's pages are on disk, so
+            # sibling pages written later in the batch are not cached as missing
+            results = [result for result, _ in built]
+            list(pool.map(lambda item: self.check_links(*item), built))
+
+        return {
+            'projects': results,
+            'total_pages': sum(r['pages'] for r in results),
+            'total_written': sum(r['written'] for r in results),
+            'total_broken_links': sum(len(r['broken_links']) for r in results),
+            'failed': [r['name'] for r in results if r['error']],
+            'cache': {
+                'pages': len(self.render_cache),
+                'svgs': len(self.svg_cache),
+                'links': len(self.link_cache),
+            },
+        }
+
+    def print_summary(self, summary):
+        print("\n📋 Build summary:")
+        for result in summary['projects']:
+            if result['error']:
+                print(f"   ❌ {result['name']}: {result['error']}")
+                continue
+            print(f"   ✅ {result['name']}: {result['pages']} pages "
+                  f"({result['written']} written), {result['svg']['shapes']} SVG shapes "
+                  f"→ {result['output']}")
+            for broken in result['broken_links']:
+                print(f"      ⚠️  Broken link {broken}")
+
+        cache = summary['cache']
+        print(f"\n🎉 {summary['total_pages']} pages across {len(summary['projects'])} projects, "
+              f"{summary['total_written']} written, {summary['total_broken_links']} broken links")
+        print(f"🗃️  Shared caches: {cache['pages']} rendered pages, {cache['svgs']} SVGs, "
+              f"{cache['links']} link targets")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build several ATAVIC diagram projects at once")
+    parser.add_argument('projects', help='JSON file: {"projects": [{"name", "svg", "config", "output"}, ...]}')
+    parser.add_argument('-j', '--workers', type=int, default=4,
+                        help="Projects built at once (overlaps I/O only; rendering is bound by the GIL)")
+    parser.add_argument('--json', dest='json_out', help="Also write the summary to this file")
+    args = parser.parse_args()
+
+    builder = ATAVICBatchBuilder(args.workers)
+
+    print("🔄 ATAVIC Batch Builder")
+    print("=" * 40)
+
+    try:
+        projects = builder.load_projects(args.projects)
+    except FileNotFoundError:
+        print(f"❌ Error: File not found: {args.projects}")
+        return 1
+    except (json.JSONDecodeError, KeyError):
+        print(f"❌ Error: Invalid projects file: {args.projects}")
+        return 1
+
+    print(f"🔨 Building {len(projects)} projects with {args.workers} workers...")
+    summary = builder.build(projects)
+    builder.print_summary(summary)
+
+    if args.json_out:
+        with open(args.json_out, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"💾 Saved to: {args.json_out}")
+
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
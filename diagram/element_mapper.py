@@ -8,6 +8,108 @@ import json
 import os
 from typing import Dict, Any
 
+# sendBeacon posts to this URL as given, so it must be the collector's absolute
+# URL whenever perf_collector.py runs on a different origin from the site
+BEACON_PATH = '/atavic-perf'
+DEFAULT_BEACON_ENDPOINT = f'http://127.0.0.1:8001{BEACON_PATH}'
+
+# Appended to the navigation code when instrumentation is enabled. It patches
+# the viewer's loader methods on the prototype, records phases with
+# performance.mark/measure and batches them into a single sendBeacon POST
+# once navigation is set up (or when the page hides).
+PERF_JS_TEMPLATE = '''
+// Load-phase instrumentation
+const atavicPerf = {{
+    endpoint: {endpoint},
+    queue: [],
+
+    // Timing must never break loading, so every recording call is guarded
+    start(phase) {{
+        try {{
+            performance.mark(`atavic:${{phase}}:start`);
+        }} catch (e) {{}}
+    }},
+
+    end(phase) {{
+        try {{
+            const name = `atavic:${{phase}}`;
+            performance.mark(`${{name}}:end`);
+            // Older engines return undefined from measure(), so read the entry back
+            performance.measure(name, `${{name}}:start`, `${{name}}:end`);
+            const measure = performance.getEntriesByName(name, 'measure').pop();
+            if (measure) {{
+                this.queue.push({{ phase, start: measure.startTime, duration: measure.duration }});
+            }}
+        }} catch (e) {{}}
+    }},
+
+    record(phase, start, duration) {{
+        this.queue.push({{ phase, start, duration }});
+    }},
+
+    // Split svg-load into network time (Resource Timing for ATAVIC.svg) and
+    // everything after the response: parse, DOM insertion and categorisation
+    splitSVG() {{
+        try {{
+            const entry = performance.getEntriesByType('resource')
+                .filter(e => e.name.split('?')[0].endsWith('/ATAVIC.svg')).pop();
+            if (!entry) return;
+            this.record('svg-fetch', entry.startTime, entry.responseEnd - entry.startTime);
+            this.record('svg-insert', entry.responseEnd, performance.now() - entry.responseEnd);
+        }} catch (e) {{}}
+    }},
+
+    flush() {{
+        if (!this.queue.length || !navigator.sendBeacon) return;
+        const payload = JSON.stringify({{ page: location.pathname, measures: this.queue }});
+        if (navigator.sendBeacon(this.endpoint, payload)) {{
+            this.queue = [];
+        }}
+    }}
+}};
+
+document.addEventListener('visibilitychange', () => {{
+    if (document.visibilityState === 'hidden') atavicPerf.flush();
+}});
+
+// Wrap the viewer's own loaders with timing rather than copying them.
+// Paste after the viewer class, before DOMContentLoaded creates the viewer.
+function atavicInstrument(viewerClass) {{
+    const proto = viewerClass.prototype;
+    const wrap = (method, phase, after) => {{
+        const original = proto[method];
+        if (typeof original !== 'function') return;
+        const finish = () => {{
+            atavicPerf.end(phase);
+            if (after) after();
+        }};
+        proto[method] = function (...args) {{
+            atavicPerf.start(phase);
+            let result;
+            try {{
+                result = original.apply(this, args);
+            }} catch (e) {{
+                finish();
+                throw e;
+            }}
+            // Async loaders end when their promise settles, sync ones immediately
+            if (result && typeof result.finally === 'function') {{
+                return result.finally(finish);
+            }}
+            finish();
+            return result;
+        }};
+    }};
+
+    wrap('loadNavigationMapping', 'nav-manifest');
+    wrap('loadSVG', 'svg-load', () => atavicPerf.splitSVG());
+    wrap('addClickableNavigation', 'navigation-setup', () => atavicPerf.flush());
+}}
+
+if (typeof ATAVICDiagramViewer !== 'undefined') atavicInstrument(ATAVICDiagramViewer);
+'''
+
+
 class ATAVICElementMapper:
     def __init__(self):
         self.text_elements = [
@@ -84,8 +186,9 @@ class ATAVICElementMapper:
         """Generate JSON dictionary"""
         return json.dumps(self.navigation_map, indent=2)
 
-    def generate_javascript(self) -> str:
-        """Generate JavaScript code for integration"""
+    def generate_javascript(self, instrument: bool = False,
+                            beacon_endpoint: str = DEFAULT_BEACON_ENDPOINT) -> str:
+        """Generate JavaScript code for integration, optionally with load-phase timing"""
         js_template = '''
 // Text Element Navigation Dictionary
 const textElementNavigation = {navigation_data};
@@ -132,7 +235,10 @@ addClickableNavigation() {{
 // Call this method after loading SVG in your constructor
 // this.addClickableNavigation();
 '''
-        return js_template.format(navigation_data=json.dumps(self.navigation_map, indent=2))
+        javascript = js_template.format(navigation_data=json.dumps(self.navigation_map, indent=2))
+        if instrument:
+            javascript += PERF_JS_TEMPLATE.format(endpoint=json.dumps(beacon_endpoint))
+        return javascript
 
     def save_to_file(self, filename: str, content: str):
         """Save content to file"""
@@ -168,23 +274,52 @@ addClickableNavigation() {{
         self.batch_mapping(example_mappings)
         return example_mappings
 
-def main():
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Map ATAVIC text elements to navigation URLs")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--mappings', metavar='JSON', help="Load {elementId: {name, url}} mappings from a file")
+    source.add_argument('--example', action='store_true', help="Use the built-in example mapping")
+    source.add_argument('--interactive', action='store_true', help="Prompt for each element")
+    parser.add_argument('--dict-out', default='navigation_dictionary.json')
+    parser.add_argument('--js-out', default='navigation_code.js')
+    parser.add_argument('--instrument', action='store_true', help="Emit load-phase performance instrumentation")
+    parser.add_argument('--endpoint', default=DEFAULT_BEACON_ENDPOINT, help="Absolute URL of perf_collector.py for --instrument "
+                        f"(default: {DEFAULT_BEACON_ENDPOINT})")
+    parser.add_argument('-f', '--force', action='store_true', help="Regenerate even if outputs are newer than --mappings")
+    args = parser.parse_args(argv)
+
+    # First line of the JS output hashes the options it was generated with, so
+    # changing --instrument/--endpoint invalidates an otherwise fresh output
+    # without writing local paths into the shipped code
+    stamp = None
+    if args.mappings:
+        from atavic_tools import build_stamp
+        stamp = "// " + build_stamp('element_mapper.py', os.path.abspath(args.mappings), args.instrument,
+                                    args.endpoint if args.instrument else '-')
+
+    if stamp and not args.force:
+        try:
+            source_mtime = max(os.path.getmtime(args.mappings), os.path.getmtime(__file__))
+            with open(args.js_out, 'r') as f:
+                previous_stamp = f.readline().rstrip('\n')
+            if previous_stamp == stamp and all(
+                    os.path.getmtime(out) >= source_mtime for out in (args.dict_out, args.js_out)):
+                print(f"✅ Up to date: {args.dict_out}, {args.js_out}")
+                return 0
+        except OSError:
+            pass
+
     mapper = ATAVICElementMapper()
     
-    print("Choose an option:")
-    print("1. Interactive mapping")
-    print("2. Create example mapping")
-    print("3. Load from existing file")
-    
-    choice = input("\nEnter choice (1-3): ").strip()
-    
-    if choice == '1':
+    if args.interactive:
         mapper.interactive_mapping()
-    elif choice == '2':
+    elif args.example:
         example = mapper.example_mapping()
         print(f"\n📋 Created example mapping with {len(example)} elements")
-    elif choice == '3':
-        filename = input("Enter JSON file path: ").strip()
+    else:
+        filename = args.mappings
         try:
             with open(filename, 'r') as f:
                 data = json.load(f)
@@ -192,24 +327,23 @@ def main():
             print(f"📁 Loaded {len(data)} mappings from {filename}")
         except FileNotFoundError:
             print(f"❌ File not found: {filename}")
-            return
+            return 1
         except json.JSONDecodeError:
             print(f"❌ Invalid JSON in file: {filename}")
-            return
-    else:
-        print("❌ Invalid choice")
-        return
+            return 1
     
     if mapper.navigation_map:
         print(f"\n🎉 Created mappings for {len(mapper.navigation_map)} elements")
         
         # Generate outputs
         dictionary = mapper.generate_dictionary()
-        javascript = mapper.generate_javascript()
+        javascript = mapper.generate_javascript(args.instrument, args.endpoint)
+        if stamp:
+            javascript = stamp + '\n' + javascript
         
         # Save files
-        mapper.save_to_file('navigation_dictionary.json', dictionary)
-        mapper.save_to_file('navigation_code.js', javascript)
+        mapper.save_to_file(args.dict_out, dictionary)
+        mapper.save_to_file(args.js_out, javascript)
         
         print("\n📋 Summary of mapped elements:")
         for element_id, data in mapper.navigation_map.items():
@@ -222,6 +356,8 @@ def main():
         print("4. Test the clickable functionality")
     else:
         print("\n⚠️  No mappings created")
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
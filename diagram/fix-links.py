@@ -1,26 +1,29 @@
 #!/usr/bin/env python3
 
-import os
-import glob
-
-pages_dir = 'pages'
-html_files = glob.glob(os.path.join(pages_dir, '*.html'))
-
-print(f"Fixing back links in {len(html_files)} HTML files...")
-
-for filepath in html_files:
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    # Fix the back link to point to the diagram correctly
-    content = content.replace(
-        'href="../index.html"',
-        'href="../diagram/index.html"'
-    )
-    
-    with open(filepath, 'w') as f:
-        f.write(content)
-    
-    print(f"✅ Fixed: {filepath}")
-
-print("\n🎉 All back links fixed!")
+import argparse
+
+from atavic_tools import fix_links
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Point back links at the diagram directory")
+    parser.add_argument('pages_dir', nargs='?', default='pages')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    if not args.quiet:
+        print(f"Fixing back links in {args.pages_dir}...")
+
+    try:
+        changed = fix_links(args.pages_dir, verbose=not args.quiet)
+    except FileNotFoundError as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    if not args.quiet:
+        print(f"\n🎉 All back links fixed! ({len(changed)} files changed)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -29,6 +29,15 @@ pagesData.pages.forEach(page => {
     console.log(`✅ Generated: ${filepath}`);
 });
 
+// Write the compact element -> [filename, title] manifest the viewers load
+const manifest = {};
+pagesData.pages.forEach(page => {
+    manifest[page.elementId] = [page.filename, page.title];
+});
+fs.writeFileSync('atavic-nav.json', JSON.stringify(manifest), 'utf8');
+
+console.log('✅ Generated: atavic-nav.json');
+
 console.log(`\n🎉 Successfully generated ${pagesData.pages.length} HTML pages!`);
 console.log('📁 All pages are in the ./pages/ directory');
 console.log('🔗 These pages are now clickable in the diagram viewer');
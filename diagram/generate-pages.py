@@ -1,34 +1,40 @@
 #!/usr/bin/env python3
 
+import argparse
 import json
 import os
 
-# Read the pages configuration
-with open('atavic-pages.json', 'r') as f:
-    pages_data = json.load(f)
-
-# Create pages directory if it doesn't exist
-pages_dir = 'pages'
-if not os.path.exists(pages_dir):
-    os.makedirs(pages_dir)
-
-print('Generating HTML pages from template...')
-
-# Generate each page
-for page in pages_data['pages']:
-    html = pages_data['template']
-    
-    # Replace template variables
-    html = html.replace('{{TITLE}}', page['title'])
-    html = html.replace('{{ELEMENT_ID}}', page['elementId'])
-    
-    # Write the file
-    filepath = os.path.join(pages_dir, page['filename'])
-    with open(filepath, 'w') as f:
-        f.write(html)
-    
-    print(f"✅ Generated: {filepath}")
-
-print(f"\n🎉 Successfully generated {len(pages_data['pages'])} HTML pages!")
-print("📁 All pages are in the ./pages/ directory")
-print("🔗 These pages are now clickable in the diagram viewer")
+from atavic_tools import generate_pages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate HTML pages from atavic-pages.json")
+    parser.add_argument('--config', default='atavic-pages.json')
+    parser.add_argument('--pages-dir', help="Output directory (default: pages/ next to the config)")
+    parser.add_argument('--manifest', help="Navigation manifest path (default: atavic-nav.json next to the config)")
+    parser.add_argument('-f', '--force', action='store_true', help="Regenerate even if up to date")
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    try:
+        written = generate_pages(args.config, args.pages_dir, args.manifest,
+                                 force=args.force, verbose=not args.quiet)
+    except FileNotFoundError as e:
+        print(f"❌ Error: File not found: {e.filename}")
+        return 1
+    except json.JSONDecodeError as e:
+        print(f"❌ Error: Invalid JSON in {args.config}: {e}")
+        return 1
+    except KeyError as e:
+        print(f"❌ Error: {args.config} is missing {e}")
+        return 1
+
+    if written and not args.quiet:
+        print(f"\n🎉 Successfully generated {len(written)} HTML pages!")
+        print(f"📁 All pages are in {os.path.dirname(written[0])}")
+        print("🔗 These pages are now clickable in the diagram viewer")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+ATAVIC Load Tester
+Replays the request pattern of a diagram.html visitor against a local server
+and reports throughput and latency percentiles per asset
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from page_generator import NAV_MANIFEST
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+# Sent with every request so precompressed assets are served (and measured) compressed
+DEFAULT_ACCEPT_ENCODING = 'gzip, br'
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class ATAVICLoadTester:
+    def __init__(self, base_url=None, config_file="atavic-pages.json",
+                 concurrency=10, visits=100, think_time=0.0, timeout=10.0,
+                 accept_encoding=DEFAULT_ACCEPT_ENCODING, probes=True):
+        self.base_url = base_url
+        self.config_file = config_file
+        self.concurrency = concurrency
+        self.visits = visits
+        self.think_time = think_time
+        self.timeout = timeout
+        self.accept_encoding = accept_encoding
+        self.probes = probes
+        self.samples = {}
+        self.errors = {}
+        self.sizes = {}
+        self.encodings = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start_local_server(self, root=None):
+        """Serve the site root on an ephemeral port and point base_url at diagram/"""
+        if root is None:
+            root = Path(__file__).resolve().parent.parent
+        handler = partial(_QuietHandler, directory=str(Path(root).resolve()))
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        host, port = self._server.server_address[:2]
+        self.base_url = f"http://{host}:{port}/diagram/"
+        return self.base_url
+
+    def stop_local_server(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def build_request_plan(self):
+        """List the (method, path) pairs a single visitor issues"""
+        with open(self.config_file, 'r') as f:
+            data = json.load(f)
+
+        plan = [
+            ('GET', 'diagram.html'),
+            ('GET', 'ATAVIC.svg'),
+            ('GET', NAV_MANIFEST),
+        ]
+        if self.probes:
+            for page in data.get('pages', []):
+                plan.append(('HEAD', f"pages/{page['filename']}"))
+        return plan
+
+    def _record(self, asset, elapsed, ok, size=0, encoding=None):
+        with self._lock:
+            if ok:
+                self.samples.setdefault(asset, []).append(elapsed)
+                self.sizes[asset] = self.sizes.get(asset, 0) + size
+                self.encodings.setdefault(asset, set()).add(encoding or 'identity')
+            else:
+                self.errors[asset] = self.errors.get(asset, 0) + 1
+
+    def _request(self, conn, method, path):
+        url = urljoin(self.base_url, path)
+        target = urlsplit(url).path
+        headers = {'Accept-Encoding': self.accept_encoding} if self.accept_encoding else {}
+        size, encoding = 0, None
+        start = time.perf_counter()
+        try:
+            conn.request(method, target, headers=headers)
+            response = conn.getresponse()
+            # http.client does not decode bodies, so this is the on-the-wire size
+            size = len(response.read())
+            encoding = response.getheader('Content-Encoding')
+            ok = response.status < 400
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            ok = False
+        self._record(f"{method} {path}", time.perf_counter() - start, ok, size, encoding)
+
+    def _visit(self, plan):
+        """Replay one visitor: page, SVG, nav manifest, then a HEAD probe per mapped URL"""
+        parts = urlsplit(self.base_url)
+        conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self.timeout)
+        try:
+            for method, path in plan:
+                self._request(conn, method, path)
+        finally:
+            conn.close()
+        if self.think_time:
+            time.sleep(random.uniform(0, 2 * self.think_time))
+
+    def run(self):
+        """Run all visits across the worker pool and return the report"""
+        plan = self.build_request_plan()
+        self.samples = {}
+        self.errors = {}
+        self.sizes = {}
+        self.encodings = {}
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for _ in pool.map(lambda _: self._visit(plan), range(self.visits)):
+                pass
+        wall_time = time.perf_counter() - start
+
+        return self.build_report(plan, wall_time)
+
+    def build_report(self, plan, wall_time):
+        assets = []
+        total_requests = 0
+        for method, path in plan:
+            asset = f"{method} {path}"
+            timings = self.samples.get(asset, [])
+            errors = self.errors.get(asset, 0)
+            total_requests += len(timings) + errors
+            assets.append({
+                'asset': asset,
+                'requests': len(timings),
+                'errors': errors,
+                'bytes_per_response': self.sizes.get(asset, 0) / len(timings) if timings else 0.0,
+                'encodings': sorted(self.encodings.get(asset, ())),
+                'throughput': len(timings) / wall_time if wall_time else 0.0,
+                'p50_ms': percentile(timings, 50) * 1000,
+                'p95_ms': percentile(timings, 95) * 1000,
+                'p99_ms': percentile(timings, 99) * 1000,
+            })
+
+        return {
+            'base_url': self.base_url,
+            'concurrency': self.concurrency,
+            'visits': self.visits,
+            'think_time': self.think_time,
+            'accept_encoding': self.accept_encoding,
+            'probes': self.probes,
+            'wall_time': wall_time,
+            'visits_per_second': self.visits / wall_time if wall_time else 0.0,
+            'requests_per_second': total_requests / wall_time if wall_time else 0.0,
+            'assets': assets,
+        }
+
+    def print_report(self, report):
+        print(f"\n📊 {report['visits']} visits, concurrency {report['concurrency']}, "
+              f"think time {report['think_time']}s")
+        print(f"   {report['visits_per_second']:.1f} visits/s, "
+              f"{report['requests_per_second']:.1f} requests/s "
+              f"in {report['wall_time']:.2f}s")
+        print()
+        print(f"   Accept-Encoding: {report['accept_encoding'] or '(none)'}, "
+              f"HEAD probes {'on' if report['probes'] else 'off'}")
+        print()
+        print(f"   {'asset':<40} {'ok':>6} {'err':>5} {'req/s':>8} {'bytes':>9} {'enc':>8} "
+              f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for row in report['assets']:
+            print(f"   {row['asset']:<40} {row['requests']:>6} {row['errors']:>5} "
+                  f"{row['throughput']:>8.1f} {row['bytes_per_response']:>9.0f} "
+                  f"{','.join(row['encodings']):>8} {row['p50_ms']:>8.2f} "
+                  f"{row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the ATAVIC diagram viewer")
+    parser.add_argument('--url', help="Base URL of the diagram/ directory "
+                        "(default: start a local server on the site root)")
+    parser.add_argument('--config', default='atavic-pages.json',
+                        help="Pages configuration listing the mapped URLs")
+    parser.add_argument('-c', '--concurrency', type=int, default=10)
+    parser.add_argument('-n', '--visits', type=int, default=100)
+    parser.add_argument('-t', '--think-time', type=float, default=0.0,
+                        help="Mean pause in seconds after each visit")
+    parser.add_argument('--accept-encoding', default=DEFAULT_ACCEPT_ENCODING,
+                        help="Accept-Encoding header to send ('' to request identity)")
+    parser.add_argument('--no-probes', action='store_true',
+                        help="Skip the per-page HEAD probes the viewer issues")
+    parser.add_argument('--json', dest='json_out', help="Also write the report to this file")
+    args = parser.parse_args()
+
+    tester = ATAVICLoadTester(args.url, args.config, args.concurrency,
+                              args.visits, args.think_time,
+                              accept_encoding=args.accept_encoding, probes=not args.no_probes)
+
+    print("🔄 ATAVIC Load Tester")
+    print("=" * 40)
+
+    if not os.path.exists(args.config):
+        print(f"❌ Error: File not found: {args.config}")
+        return 1
+
+    if tester.base_url is None:
+        print(f"🌐 Serving site locally at {tester.start_local_server()}")
+
+    try:
+        report = tester.run()
+    finally:
+        tester.stop_local_server()
+
+    tester.print_report(report)
+
+    if args.json_out:
+        with open(args.json_out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Saved to: {args.json_out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
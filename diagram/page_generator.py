@@ -5,9 +5,12 @@ Takes the JSON output from the Element Identifier and creates actual HTML pages
 """
 
 import json
-import os
 from pathlib import Path
 
+# Compact element -> page lookup fetched by the viewers instead of the full
+# atavic-pages.json (whose bytes are mostly the page template)
+NAV_MANIFEST = "atavic-nav.json"
+
 class ATAVICPageGenerator:
     def __init__(self):
         self.template = '''<!DOCTYPE html>
@@ -266,6 +269,23 @@ class ATAVICPageGenerator:
 
         return created_pages
 
+    def build_navigation_manifest(self, data):
+        """Map each elementId to [filename, title] for the diagram viewers"""
+        return {page['elementId']: [page['filename'], page['title']] for page in data['pages']}
+
+    def serialize_navigation_manifest(self, data):
+        """Render the manifest in its minimal JSON layout"""
+        return json.dumps(self.build_navigation_manifest(data), separators=(',', ':'), ensure_ascii=False)
+
+    def create_navigation_manifest(self, data, manifest_path=NAV_MANIFEST, verbose=True):
+        """Write the compact navigation manifest next to the diagram"""
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            f.write(self.serialize_navigation_manifest(data))
+        
+        if verbose:
+            print(f"✅ Created navigation manifest: {manifest_path}")
+        return manifest_path
+
     def create_index_page(self, created_pages, output_dir):
         """Create an index page linking to all generated pages"""
         index_content = '''<!DOCTYPE html>
@@ -389,48 +409,61 @@ class ATAVICPageGenerator:
         
         print(f"✅ Created index page: {index_path}")
 
-def main():
+def main(argv=None):
+    import argparse
+    from atavic_tools import build_stamp, clear_stamp, pages_up_to_date, write_stamp
+
+    parser = argparse.ArgumentParser(description="Generate themed ATAVIC pages from identified elements")
+    parser.add_argument('--config', default='atavic-pages.json', help="JSON file from the Element Identifier")
+    parser.add_argument('--output', help="Output directory (default: pages/ next to the config)")
+    parser.add_argument('--manifest', help="Navigation manifest path (default: atavic-nav.json next to the config)")
+    parser.add_argument('-f', '--force', action='store_true', help="Regenerate even if up to date")
+    args = parser.parse_args(argv)
+
+    json_file = args.config
+    pages_dir = Path(args.output) if args.output else Path(json_file).with_name("pages")
+    manifest_path = Path(args.manifest) if args.manifest else Path(json_file).with_name(NAV_MANIFEST)
+
     generator = ATAVICPageGenerator()
     
     print("🔄 ATAVIC Page Generator")
     print("=" * 40)
     
-    # Check for default JSON file
-    default_json = "atavic-pages.json"
-    
-    if os.path.exists(default_json):
-        print(f"📁 Found {default_json}")
-        json_file = default_json
-    else:
-        json_file = input("Enter path to JSON file (or press Enter to use 'atavic-pages.json'): ").strip()
-        if not json_file:
-            json_file = default_json
-    
     # Load data
     print(f"📖 Loading data from {json_file}...")
     data = generator.load_from_json_file(json_file)
     
     if not data:
         print("❌ Failed to load data. Exiting.")
-        return
+        return 1
     
     if not data.get('pages'):
         print("❌ No pages found in the data. Make sure you've identified elements first.")
-        return
+        return 1
+    
+    # The page and index templates live in this file, so its source is part of the stamp
+    with open(__file__, 'rb') as source:
+        stamp = build_stamp('page_generator', json.dumps(data, sort_keys=True),
+                            manifest_path.resolve(), source.read())
+    outputs = [pages_dir / page['filename'] for page in data['pages']]
+    outputs += [pages_dir / "index.html", manifest_path]
     
-    # Ask for output directory
-    output_dir = input("Enter output directory (or press Enter to use './pages'): ").strip()
-    if not output_dir:
-        output_dir = None  # Will use default
+    if not args.force and pages_up_to_date(pages_dir, outputs, stamp):
+        print(f"✅ Up to date: {pages_dir}")
+        return 0
     
     # Generate pages
     print(f"\n🔨 Generating {len(data['pages'])} pages...")
-    created_pages = generator.generate_pages(data, output_dir)
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    clear_stamp(pages_dir)
+    created_pages = generator.generate_pages(data, pages_dir)
     
     if created_pages:
         # Create index page
-        pages_dir = Path(output_dir) if output_dir else generator.create_pages_directory()
         generator.create_index_page(created_pages, pages_dir)
+        generator.create_navigation_manifest(data, manifest_path)
+        if len(created_pages) == len(data['pages']):
+            write_stamp(pages_dir, stamp)
         
         print(f"\n🎉 Successfully created {len(created_pages)} pages!")
         print(f"📂 Output directory: {pages_dir}")
@@ -440,8 +473,10 @@ def main():
         
         print(f"\n🌐 View the index at: {pages_dir}/index.html")
         print("💡 Now you can edit each HTML file to add your own content!")
+        return 0
     else:
         print("❌ No pages were created. Check the error messages above.")
+        return 1
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
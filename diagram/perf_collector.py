@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+ATAVIC Performance Collector
+Receives the sendBeacon batches emitted by instrumented viewer code
+(see ATAVICElementMapper.generate_javascript) and reports load-phase percentiles
+"""
+
+import argparse
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from element_mapper import BEACON_PATH
+from load_tester import percentile
+
+
+class ATAVICPerfCollector:
+    def __init__(self, log_file=None):
+        self.log_file = log_file
+        self.measures = {}
+        self.beacon_count = 0
+        self._lock = threading.Lock()
+
+    def validate_beacon(self, beacon):
+        """Raise ValueError unless beacon is {"measures": [{"phase": str, "duration": number}, ...]}"""
+        if not isinstance(beacon, dict):
+            raise ValueError("beacon must be a JSON object")
+        measures = beacon.get('measures', [])
+        if not isinstance(measures, list):
+            raise ValueError("measures must be a list")
+        for measure in measures:
+            if not isinstance(measure, dict) or not isinstance(measure.get('phase'), str):
+                raise ValueError("each measure needs a string phase")
+            duration = measure.get('duration')
+            if isinstance(duration, bool) or not isinstance(duration, (int, float)):
+                raise ValueError("each measure needs a numeric duration")
+            # json.loads accepts NaN, Infinity and overflowing literals like 1e400
+            if not math.isfinite(duration) or duration < 0:
+                raise ValueError("each duration must be finite and non-negative")
+
+    def add_beacon(self, beacon):
+        """Record one beacon payload: {"page": ..., "measures": [{"phase", "duration"}, ...]}"""
+        self.validate_beacon(beacon)
+        with self._lock:
+            self.beacon_count += 1
+            for measure in beacon.get('measures', []):
+                self.measures.setdefault(measure['phase'], []).append(float(measure['duration']))
+            if self.log_file:
+                with open(self.log_file, 'a') as f:
+                    f.write(json.dumps(beacon) + '\n')
+
+    def load_log(self, log_file):
+        """Replay beacons previously appended to a JSON-lines log"""
+        with open(log_file, 'r') as f:
+            for line in f:
+                if line.strip():
+                    self.add_beacon(json.loads(line))
+
+    def build_report(self):
+        with self._lock:
+            phases = []
+            for phase, durations in self.measures.items():
+                phases.append({
+                    'phase': phase,
+                    'samples': len(durations),
+                    'p50_ms': percentile(durations, 50),
+                    'p95_ms': percentile(durations, 95),
+                    'p99_ms': percentile(durations, 99),
+                })
+            return {'beacons': self.beacon_count, 'phases': phases}
+
+    def print_report(self, report):
+        print(f"\n📊 {report['beacons']} beacons received")
+        print(f"   {'phase':<20} {'samples':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for row in report['phases']:
+            print(f"   {row['phase']:<20} {row['samples']:>8} {row['p50_ms']:>8.2f} "
+                  f"{row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f}")
+
+    def make_server(self, host='127.0.0.1', port=8001, path=BEACON_PATH):
+        """Build an HTTP server accepting beacons on `path` and serving the report on GET"""
+        collector = self
+
+        class BeaconHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != path:
+                    self.send_error(404)
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    collector.add_beacon(json.loads(self.rfile.read(length)))
+                except ValueError:
+                    self.send_error(400)
+                    return
+                self.send_response(204)
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+
+            def do_GET(self):
+                if self.path != path:
+                    self.send_error(404)
+                    return
+                body = json.dumps(collector.build_report(), indent=2).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return ThreadingHTTPServer((host, port), BeaconHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect ATAVIC viewer performance beacons")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('-p', '--port', type=int, default=8001)
+    parser.add_argument('--path', default=BEACON_PATH, help="URL path that accepts beacons")
+    parser.add_argument('--log', help="Append every beacon to this JSON-lines file")
+    parser.add_argument('--report', metavar='LOG',
+                        help="Print the percentile report for an existing log and exit")
+    args = parser.parse_args()
+
+    collector = ATAVICPerfCollector(args.log)
+
+    if args.report:
+        collector.load_log(args.report)
+        collector.print_report(collector.build_report())
+        return
+
+    server = collector.make_server(args.host, args.port, args.path)
+    print("🔄 ATAVIC Performance Collector")
+    print("=" * 40)
+    print(f"📡 Listening on http://{args.host}:{args.port}{args.path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    collector.print_report(collector.build_report())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,29 @@
 #!/usr/bin/env python3
 
-import os
-import glob
-
-pages_dir = 'pages'
-html_files = glob.glob(os.path.join(pages_dir, '*.html'))
-
-print(f"Updating links in {len(html_files)} HTML files to point to diagram.html...")
-
-for filepath in html_files:
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    # Update the back link to point to diagram.html
-    content = content.replace(
-        'href="../diagram/index.html"',
-        'href="../diagram/diagram.html"'
-    )
-    
-    with open(filepath, 'w') as f:
-        f.write(content)
-    
-    print(f"✅ Updated: {filepath}")
-
-print("\n🎉 All links updated to point to diagram.html!")
+import argparse
+
+from atavic_tools import update_links
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Point back links at diagram.html")
+    parser.add_argument('pages_dir', nargs='?', default='pages')
+    parser.add_argument('-q', '--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    if not args.quiet:
+        print(f"Updating links to point to diagram.html in {args.pages_dir}...")
+
+    try:
+        changed = update_links(args.pages_dir, verbose=not args.quiet)
+    except FileNotFoundError as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    if not args.quiet:
+        print(f"\n🎉 All links updated to point to diagram.html! ({len(changed)} files changed)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())